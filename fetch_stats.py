@@ -8,19 +8,39 @@ GitHub API calls.
 
 OPTIMIZATIONS:
 - Skip ended hackathons (keeps historical data static)
-- Incremental review fetching (only fetch reviews for PRs updated since last run)
-- Org repos caching (fetch once, reuse for all hackathons)
+- Incremental fetching: raw PR/review/issue records are kept between runs
+  and only items updated since each repository's watermark are re-fetched
+- Org repos caching (fetch once, reuse for all hackathons and for 24h
+  across runs)
+- Persistent keep-alive connections per worker thread, gzip responses
+- Header-driven rate limiting shared by all workers (waits for the reset
+  before the quota runs out instead of sleeping after 403/429 responses)
+- Conditional REST requests (ETags cached between runs turn unchanged pages
+  into free 304 responses)
+- GraphQL per-repo queries (PRs + reviews + issues + metadata in one round
+  trip, selecting only the fields used); REST is the unauthenticated fallback
+- Compact JSON for the per-hackathon detail files
+- Stats window checks compare raw timestamp strings, so only in-window
+  records are parsed
+- Active hackathons processed in parallel
+- Single shared request pool per hackathon (PRs, reviews, issues and
+  metadata are fetched concurrently instead of in separate phases)
 """
 
+import gzip
 import json
 import logging
 import os
 import sys
+import threading
 import time
+from collections import Counter
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, datetime, timedelta, timezone
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+from http.client import HTTPConnection, HTTPException, HTTPSConnection, RemoteDisconnected
+from itertools import chain
+from operator import itemgetter
+from urllib.parse import urljoin, urlsplit
 
 import yaml
 
@@ -31,68 +51,530 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 GITHUB_API_BASE = "https://api.github.com"
+GITHUB_GRAPHQL_URL = f"{GITHUB_API_BASE}/graphql"
+# Upper bound on concurrent GitHub requests per hackathon
+MAX_WORKERS = 16
+# Active hackathons processed at the same time (each with its own pool)
+MAX_PARALLEL_HACKATHONS = 4
+
+# Serialises org repo lookups so concurrent hackathons share one fetch
+_org_repos_lock = threading.Lock()
+# Per-thread keep-alive connections, see _get_connection()
+_thread_local = threading.local()
+
+# Requests left unspent per rate-limit window, and the longest single sleep
+# (longer waits are slept in several steps)
+RATE_LIMIT_RESERVE = 100
+MAX_RATE_LIMIT_WAIT = 300
+# Redirects followed per request (renamed or transferred repos and orgs)
+MAX_REDIRECTS = 3
+
+# Reviews for a batch of PRs, looked up by node id
+REVIEWS_GRAPHQL_QUERY = """
+query($ids: [ID!]!) {
+  nodes(ids: $ids) {
+    ... on PullRequest {
+      reviews(first: 100) {
+        nodes {
+          databaseId
+          state
+          submittedAt
+          url
+          author { __typename login avatarUrl url }
+        }
+        pageInfo { hasNextPage }
+      }
+    }
+  }
+}
+"""
+# GraphQL accepts at most 100 ids per nodes() lookup
+REVIEW_BATCH_SIZE = 100
+
+# Run-to-run caches live outside hackathon-data/ so they are neither
+# committed nor published; the workflow restores them with actions/cache.
+CACHE_DIR = os.environ.get("STATS_CACHE_DIR", ".cache")
+ETAG_CACHE_PATH = os.path.join(CACHE_DIR, "etags.json")
+RAW_STORE_DIR = os.path.join(CACHE_DIR, "raw")
+ORG_CACHE_PATH = os.path.join(CACHE_DIR, "org-repos.json")
+# Org repository lists change rarely; re-list each org at most once a day
+ORG_CACHE_TTL = timedelta(hours=24)
+# Incremental fetches start this far before a stored watermark so items
+# GitHub indexes late are still picked up
+WATERMARK_MARGIN = timedelta(minutes=5)
+
+# Fields kept in the raw store; everything else GitHub returns is unused
+PR_FIELDS = (
+    "node_id", "number", "title", "html_url", "created_at", "updated_at",
+    "merged_at", "user", "repository",
+)
+REVIEW_FIELDS = (
+    "id", "user", "state", "submitted_at", "html_url", "repository",
+    "pull_request_url", "pull_request_title", "pull_request_author",
+)
+ISSUE_FIELDS = ("number", "state", "created_at", "updated_at", "closed_at", "repository")
+USER_FIELDS = ("login", "avatar_url", "html_url")
+INTERNED_FIELDS = ("repository", "state", "pull_request_author")
+
+# url -> {"etag": ..., "body": parsed JSON} for conditional GETs.  Only
+# entries requested during this run are written back, so the file does
+# not grow without bound.
+_etag_cache = {}
+_etag_cache_used = set()
+
+# One query returns repository metadata plus a page of PRs (with their
+# reviews) and a page of issues, selecting only the fields the stats use.
+# Both connections are ordered by UPDATED_AT so paging can stop as soon as
+# items predate the hackathon window.
+REPO_GRAPHQL_QUERY = """
+query($owner: String!, $name: String!, $prCursor: String, $issueCursor: String,
+      $withPRs: Boolean!, $withIssues: Boolean!) {
+  repository(owner: $owner, name: $name) {
+    nameWithOwner
+    description
+    stargazerCount
+    forkCount
+    url
+    primaryLanguage { name }
+    pullRequests(first: 100, after: $prCursor,
+                 orderBy: {field: UPDATED_AT, direction: DESC}) @include(if: $withPRs) {
+      nodes {
+        id
+        number
+        title
+        url
+        createdAt
+        updatedAt
+        mergedAt
+        author { __typename login avatarUrl url }
+        reviews(first: 50) {
+          nodes {
+            databaseId
+            state
+            submittedAt
+            url
+            author { __typename login avatarUrl url }
+          }
+          pageInfo { hasNextPage }
+        }
+      }
+      pageInfo { hasNextPage endCursor }
+    }
+    issues(first: 100, after: $issueCursor,
+           orderBy: {field: UPDATED_AT, direction: DESC}) @include(if: $withIssues) {
+      nodes { number state createdAt updatedAt closedAt }
+      pageInfo { hasNextPage endCursor }
+    }
+  }
+}
+"""
+
+
+def parse_gh_ts(value):
+    """Parse a GitHub timestamp into a timezone-aware UTC datetime.
+
+    GitHub always returns the fixed ``YYYY-MM-DDTHH:MM:SSZ`` form, which is
+    sliced directly; anything else goes through ``datetime.fromisoformat``.
+    """
+    if len(value) == 20 and value[19] == "Z":
+        return datetime(
+            int(value[0:4]), int(value[5:7]), int(value[8:10]),
+            int(value[11:13]), int(value[14:16]), int(value[17:19]),
+            tzinfo=timezone.utc,
+        )
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def gh_ts_bounds(start_dt, end_dt):
+    """Return GitHub-format timestamp strings bracketing ``[start_dt, end_dt]``.
+
+    GitHub timestamps have one-second resolution and sort lexicographically,
+    so ``lower <= ts <= upper`` on the raw strings gives the same answer as
+    comparing parsed datetimes against the window.
+    """
+    start = start_dt.astimezone(timezone.utc)
+    if start.microsecond:
+        start = start.replace(microsecond=0) + timedelta(seconds=1)
+    end = end_dt.astimezone(timezone.utc).replace(microsecond=0)
+    return start.strftime("%Y-%m-%dT%H:%M:%SZ"), end.strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
 def is_hackathon_active(start_time, end_time):
     """Check if a hackathon is currently active or upcoming."""
     now = datetime.now(timezone.utc)
-    end_dt = datetime.fromisoformat(end_time.replace("Z", "+00:00"))
+    end_dt = parse_gh_ts(end_time)
     # Keep updating if hackathon hasn't ended yet
     return now <= end_dt
 
 
-def load_existing_data(slug):
-    """Load existing hackathon data if it exists."""
-    output_path = f"hackathon-data/{slug}.json"
-    if os.path.exists(output_path):
-        try:
-            with open(output_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception as exc:
-            logger.warning("Could not load existing data for %s: %s", slug, exc)
-    return None
+def write_json(path, data, indent=None):
+    """Write ``data`` as JSON, compact unless an indent is requested.
+
+    The document is serialised in one pass and written with a single call;
+    ``json.dump`` instead streams many small chunks to the file.
+    """
+    separators = (",", ":") if indent is None else None
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(json.dumps(data, indent=indent, separators=separators))
+
+
+def load_etag_cache():
+    """Load the conditional-request cache saved by a previous run."""
+    _etag_cache.clear()
+    _etag_cache_used.clear()
+    if not os.path.exists(ETAG_CACHE_PATH):
+        return
+    try:
+        with open(ETAG_CACHE_PATH, "r", encoding="utf-8") as f:
+            _etag_cache.update(json.load(f))
+        logger.info("Loaded %d cached ETags", len(_etag_cache))
+    except Exception as exc:
+        logger.warning("Could not load ETag cache: %s", exc)
+
+
+def save_etag_cache():
+    """Persist the ETags (and bodies) of every URL requested during this run."""
+    entries = {url: _etag_cache[url] for url in _etag_cache_used if url in _etag_cache}
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        write_json(ETAG_CACHE_PATH, entries)
+        logger.info("Saved %d cached ETags", len(entries))
+    except Exception as exc:
+        logger.warning("Could not save ETag cache: %s", exc)
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _slim(record, fields):
+    """Return a copy of a GitHub record with only the given fields.
+
+    Strings that repeat across records (repository names, logins, avatar
+    URLs, review states) are interned so all records share one copy.
+    """
+    slim = {key: record[key] for key in fields if key in record}
+    for key in INTERNED_FIELDS:
+        if key in slim:
+            slim[key] = _intern(slim[key])
+    if slim.get("user"):
+        user = slim["user"]
+        slim["user"] = {key: _intern(user[key]) for key in USER_FIELDS if key in user}
+    return slim
+
+
+def load_raw_store(slug, window):
+    """Load the per-repository PR/review/issue records saved by the last run.
+
+    Each record carries the ``[startTime, endTime]`` window it was fetched
+    for; records from a different window are dropped, since items from any
+    newly covered period were never fetched.  Returns a dict mapping
+    ``owner/repo`` to its record, or an empty dict if there is no usable
+    store (every repository is then fetched in full).
+    """
+    path = os.path.join(RAW_STORE_DIR, f"{slug}.jsonl.gz")
+    store = {}
+    if not os.path.exists(path):
+        return store
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                record = json.loads(line)
+                if record.get("window") != window:
+                    continue
+                # Re-slim to intern the strings the JSON decoder duplicated
+                record["prs"] = [_slim(pr, PR_FIELDS) for pr in record["prs"]]
+                record["reviews"] = [_slim(r, REVIEW_FIELDS) for r in record["reviews"]]
+                record["issues"] = [_slim(issue, ISSUE_FIELDS) for issue in record["issues"]]
+                store[record["repository"]] = record
+    except Exception as exc:
+        logger.warning("Could not load raw store for %s: %s", slug, exc)
+        return {}
+    return store
+
+
+def save_raw_store(slug, store):
+    """Write the per-repository records, one JSON line per repository."""
+    path = os.path.join(RAW_STORE_DIR, f"{slug}.jsonl.gz")
+    try:
+        os.makedirs(RAW_STORE_DIR, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            for repo_path in sorted(store):
+                f.write(json.dumps(store[repo_path]) + "\n")
+        os.replace(tmp_path, path)
+    except Exception as exc:
+        logger.warning("Could not save raw store for %s: %s", slug, exc)
+
+
+def load_org_repos_cache():
+    """Load org repository lists fetched by earlier runs within the TTL.
+
+    Returns a dict mapping org name to ``{"repos": [...], "fetched_at": ...}``.
+    """
+    if not os.path.exists(ORG_CACHE_PATH):
+        return {}
+    try:
+        with open(ORG_CACHE_PATH, "r", encoding="utf-8") as f:
+            entries = json.load(f)
+        now = datetime.now(timezone.utc)
+        return {
+            org: entry
+            for org, entry in entries.items()
+            if isinstance(entry.get("repos"), list)
+            and now - parse_gh_ts(entry["fetched_at"]) < ORG_CACHE_TTL
+        }
+    except Exception as exc:
+        logger.warning("Could not load org repos cache: %s", exc)
+        return {}
+
+
+def save_org_repos_cache(entries, org_repos_cache):
+    """Persist the org repository lists used during this run.
+
+    Lists that came from ``entries`` keep their original fetch time so the
+    TTL counts from when GitHub was actually asked.
+    """
+    now = datetime.now(timezone.utc).isoformat()
+    merged = {}
+    for org, repos in org_repos_cache.items():
+        entry = entries.get(org)
+        if entry is None or entry["repos"] is not repos:
+            entry = {"repos": repos, "fetched_at": now}
+        merged[org] = entry
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        write_json(ORG_CACHE_PATH, merged)
+    except Exception as exc:
+        logger.warning("Could not save org repos cache: %s", exc)
 
 
-def make_request(url, token=None, retry_count=3):
-    """Make a single GitHub API request with retry/back-off logic."""
+class GitHubRateLimiter:
+    """Pace requests using the rate-limit headers GitHub sends on every response.
+
+    Quota is tracked per rate-limit resource (``core`` for REST, ``graphql``
+    and so on).  Each request takes one unit up front, so concurrent workers
+    cannot all race past the limit; once a resource is down to its reserve,
+    requests wait until its reset has actually passed instead of running
+    into 403/429 responses.  A rate-limit reply blocks the whole resource
+    for the advised wait, so every worker backs off rather than just the one
+    that hit it.
+    """
+
+    def __init__(self, reserve=RATE_LIMIT_RESERVE, max_wait=MAX_RATE_LIMIT_WAIT):
+        self.reserve = reserve
+        self.max_wait = max_wait
+        self._lock = threading.Lock()
+        self._remaining = {}
+        self._limit = {}
+        self._reset_at = {}
+        self._blocked_until = {}
+
+    def acquire(self, resource):
+        """Wait until a request against ``resource`` may be sent."""
+        while True:
+            with self._lock:
+                now = time.time()
+                wait = self._blocked_until.get(resource, 0) - now
+                remaining = self._remaining.get(resource)
+                if remaining is not None:
+                    # Keep a small slice of quota back (10% of the limit at most)
+                    reserve = min(self.reserve, self._limit.get(resource, 0) // 10)
+                    if remaining <= reserve:
+                        wait = max(wait, self._reset_at.get(resource, 0) - now + 1)
+                if wait <= 0:
+                    if remaining is not None:
+                        self._remaining[resource] = remaining - 1
+                    return
+            wait = min(wait, self.max_wait)
+            logger.warning("Pacing %s requests: waiting %ds for rate limit", resource, wait)
+            time.sleep(wait)
+
+    def update(self, resource, headers):
+        """Record the quota reported by a response's headers."""
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+        resource = headers.get("X-RateLimit-Resource", resource)
+        with self._lock:
+            self._remaining[resource] = int(remaining)
+            self._reset_at[resource] = int(reset)
+            self._limit[resource] = int(headers.get("X-RateLimit-Limit", 0))
+
+    def block(self, resource, seconds):
+        """Hold back every request against ``resource`` for ``seconds``."""
+        with self._lock:
+            until = time.time() + seconds
+            if until > self._blocked_until.get(resource, 0):
+                self._blocked_until[resource] = until
+
+
+_rate_limiter = GitHubRateLimiter()
+
+
+def _rate_limit_resource(url):
+    """Return the GitHub rate-limit resource a request URL counts against."""
+    if url == GITHUB_GRAPHQL_URL:
+        return "graphql"
+    if url.startswith(f"{GITHUB_API_BASE}/search/"):
+        return "search"
+    return "core"
+
+
+def _is_rate_limited(status, headers, raw):
+    """Tell a rate-limit reply apart from other 403s (permissions, blocked repos)."""
+    if status == 429:
+        return True
+    if status != 403:
+        return False
+    if headers.get("X-RateLimit-Remaining") == "0" or headers.get("Retry-After"):
+        return True
+    # Secondary rate limits are only identified by their message
+    try:
+        if headers.get("Content-Encoding") == "gzip":
+            raw = gzip.decompress(raw)
+    except OSError:
+        return False
+    return b"secondary rate limit" in raw.lower()
+
+
+def _retry_after(headers, attempt):
+    """Return how long to wait before retrying a rate-limited request."""
+    retry_after = headers.get("Retry-After") if headers else None
+    if retry_after and retry_after.isdigit():
+        return int(retry_after)
+    reset = headers.get("X-RateLimit-Reset") if headers else None
+    if reset and headers.get("X-RateLimit-Remaining") == "0":
+        return max(int(reset) - int(time.time()) + 5, 10)
+    # Secondary rate limits carry no reset hint; back off exponentially
+    return 60 * (2 ** attempt)
+
+
+def _get_connection(scheme, netloc):
+    """Return this thread's persistent connection to ``netloc``.
+
+    Reusing one keep-alive connection per worker thread avoids paying a TCP
+    and TLS handshake on every request.
+    """
+    connections = getattr(_thread_local, "connections", None)
+    if connections is None:
+        connections = _thread_local.connections = {}
+    conn = connections.get((scheme, netloc))
+    if conn is None:
+        conn_class = HTTPSConnection if scheme == "https" else HTTPConnection
+        conn = connections[(scheme, netloc)] = conn_class(netloc, timeout=30)
+    return conn
+
+
+def _drop_connection(scheme, netloc):
+    """Close and forget this thread's connection to ``netloc``."""
+    conn = getattr(_thread_local, "connections", {}).pop((scheme, netloc), None)
+    if conn is not None:
+        conn.close()
+
+
+def make_request(url, token=None, retry_count=3, payload=None, max_redirects=MAX_REDIRECTS):
+    """Make a single GitHub API request with retry/back-off logic.
+
+    When ``payload`` is given it is sent as a JSON POST body (used for
+    GraphQL queries); otherwise a GET is issued.  GETs are conditional on
+    the ETag cached for the URL: a 304 reply costs no rate-limit quota and
+    returns the cached body without downloading or parsing it again.
+    Redirects are followed up to ``max_redirects`` hops.
+    """
     headers = {
         "Accept": "application/vnd.github.v3+json",
+        "Accept-Encoding": "gzip",
         "User-Agent": "BLT-Hackathons-Stats-Fetcher/1.0",
     }
     if token:
         headers["Authorization"] = f"Bearer {token}"
+    data = None
+    if payload is not None:
+        data = json.dumps(payload).encode("utf-8")
+        headers["Content-Type"] = "application/json"
+    else:
+        _etag_cache_used.add(url)
+        cached = _etag_cache.get(url)
+        if cached:
+            headers["If-None-Match"] = cached["etag"]
+
+    parts = urlsplit(url)
+    path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+    method = "GET" if payload is None else "POST"
+    resource = _rate_limit_resource(url)
 
     for attempt in range(retry_count):
+        _rate_limiter.acquire(resource)
+        conn = _get_connection(parts.scheme, parts.netloc)
         try:
-            req = Request(url, headers=headers)
-            with urlopen(req, timeout=30) as response:
-                return json.loads(response.read().decode("utf-8"))
-        except HTTPError as e:
-            if e.code in (429, 403):
-                reset = e.headers.get("X-RateLimit-Reset")
-                wait = max(int(reset) - int(time.time()) + 5, 10) if reset else 60
-                logger.warning("Rate limited on %s. Waiting %ds...", url, min(wait, 300))
-                time.sleep(min(wait, 300))
-            elif e.code == 404:
-                logger.warning("Not found: %s", url)
+            conn.request(method, path, body=data, headers=headers)
+            response = conn.getresponse()
+            # Always drain the body so the connection can be reused
+            raw = response.read()
+        except (HTTPException, OSError) as e:
+            _drop_connection(parts.scheme, parts.netloc)
+            if attempt == 0 and isinstance(e, (RemoteDisconnected, ConnectionResetError, BrokenPipeError)):
+                # The server closed an idle keep-alive connection; retry at once
+                continue
+            logger.error("Connection error for %s: %s", url, e)
+            if attempt < retry_count - 1:
+                time.sleep(5 * (2 ** attempt))
+                continue
+            return None
+
+        _rate_limiter.update(resource, response.headers)
+        status = response.status
+        if 200 <= status < 300:
+            if response.headers.get("Content-Encoding") == "gzip":
+                raw = gzip.decompress(raw)
+            body = json.loads(raw)
+            etag = response.headers.get("ETag")
+            if payload is None and etag:
+                _etag_cache[url] = {"etag": etag, "body": body}
+            return body
+        if status == 304:
+            return _etag_cache[url]["body"]
+        if status in (301, 302, 307, 308) and response.headers.get("Location"):
+            location = urljoin(url, response.headers["Location"])
+            if max_redirects <= 0:
+                logger.error("Too many redirects for %s", url)
                 return None
-            else:
-                logger.error("HTTP %d for %s: %s", e.code, url, e.reason)
-                if attempt < retry_count - 1:
-                    time.sleep(5 * (attempt + 1))
-                else:
-                    return None
-        except URLError as e:
-            logger.error("URL error for %s: %s", url, e)
+            logger.info("Following redirect from %s to %s", url, location)
+            # Only send the token on to the same host
+            same_host = urlsplit(location).netloc == parts.netloc
+            return make_request(
+                location, token if same_host else None, retry_count, payload, max_redirects - 1
+            )
+        if _is_rate_limited(status, response.headers, raw):
+            wait = _retry_after(response.headers, attempt)
+            logger.warning("Rate limited on %s. Waiting %ds...", url, wait)
+            # The next attempt's acquire() sleeps out the block
+            _rate_limiter.block(resource, wait)
+        elif status == 404:
+            logger.warning("Not found: %s", url)
+            return None
+        else:
+            logger.error("HTTP %d for %s: %s", status, url, response.reason)
             if attempt < retry_count - 1:
-                time.sleep(5 * (attempt + 1))
+                time.sleep(5 * (2 ** attempt))
             else:
                 return None
     return None
 
 
-def fetch_all_pages(base_url, token=None, max_pages=100):
-    """Fetch all pages from a paginated GitHub API endpoint."""
+def fetch_all_pages(base_url, token=None, max_pages=100, stop_when=None):
+    """Fetch all pages from a paginated GitHub API endpoint.
+
+    Args:
+        stop_when: Optional callable given each page of items; paging stops
+            after the first page for which it returns True.
+
+    Raises:
+        RuntimeError: if any page cannot be fetched, so callers never mistake
+            a failed or truncated listing for an empty or complete one.
+    """
     all_items = []
     page = 1
     per_page = 100
@@ -102,6 +584,8 @@ def fetch_all_pages(base_url, token=None, max_pages=100):
         url = f"{base_url}{sep}per_page={per_page}&page={page}"
         items = make_request(url, token)
 
+        if items is None:
+            raise RuntimeError(f"Failed to fetch page {page} of {base_url.split('?')[0]}")
         if not items:
             break
 
@@ -109,11 +593,10 @@ def fetch_all_pages(base_url, token=None, max_pages=100):
 
         if len(items) < per_page or page >= max_pages:
             break
+        if stop_when and stop_when(items):
+            break
 
         page += 1
-        # Reduced sleep when token is present, as we are parallelizing
-        if not token:
-            time.sleep(0.2)
 
     logger.info("Fetched %d items from %s", len(all_items), base_url.split("?")[0])
     return all_items
@@ -170,28 +653,45 @@ def fetch_org_repos(org, token=None):
     return [r["full_name"] for r in repos if r and "full_name" in r]
 
 
-def fetch_pull_requests(owner, repo, start_dt, end_dt, token=None):
-    """Fetch all pull requests for a repository within the date range."""
+def fetch_pull_requests(owner, repo, start_dt, end_dt, token=None, since=None):
+    """Fetch all pull requests for a repository within the date range.
+
+    When ``since`` is given, only PRs updated at or after it are returned.
+    """
     logger.info("Fetching PRs for %s/%s", owner, repo)
     url = (
         f"{GITHUB_API_BASE}/repos/{owner}/{repo}"
-        "/pulls?state=all&sort=created&direction=desc"
+        "/pulls?state=all&sort=updated&direction=desc"
+    )
+    # A PR created or merged in the window was updated after it started, so
+    # with the newest updates first, paging stops once a page ends before
+    # both the hackathon start and the caller's watermark. In steady state
+    # that is a single page, and an unchanged page is a 304 via its ETag.
+    # The Search API (updated:>=since) is deliberately not used here: it is
+    # capped at 10 requests/minute unauthenticated (this path is the REST
+    # fallback: no token, or GraphQL failed), has no conditional requests,
+    # and its results lack fields that /pulls returns, so it would cost
+    # more than it saves.
+    cutoff = max(start_dt, since) if since else start_dt
+    all_prs = fetch_all_pages(
+        url, token, stop_when=lambda page: parse_gh_ts(page[-1]["updated_at"]) < cutoff
     )
-    all_prs = fetch_all_pages(url, token)
 
     filtered = []
     for pr in all_prs:
-        created_at = datetime.fromisoformat(pr["created_at"].replace("Z", "+00:00"))
+        if parse_gh_ts(pr["updated_at"]) < cutoff:
+            continue
+        created_at = parse_gh_ts(pr["created_at"])
         merged_at = (
-            datetime.fromisoformat(pr["merged_at"].replace("Z", "+00:00"))
+            parse_gh_ts(pr["merged_at"])
             if pr.get("merged_at")
             else None
         )
         relevant_by_creation = start_dt <= created_at <= end_dt
         relevant_by_merge = merged_at and start_dt <= merged_at <= end_dt
         if relevant_by_creation or relevant_by_merge:
-            pr["repository"] = f"{owner}/{repo}"
-            filtered.append(pr)
+            # Annotate a copy: ``pr`` may be shared with the ETag cache
+            filtered.append(_slim({**pr, "repository": f"{owner}/{repo}"}, PR_FIELDS))
 
     logger.info("  -> %d PRs in date range for %s/%s", len(filtered), owner, repo)
     return filtered
@@ -203,12 +703,82 @@ def fetch_reviews_for_pr(owner, repo, pr_number, token=None):
     return fetch_all_pages(url, token)
 
 
-def fetch_issues(owner, repo, start_dt, end_dt, token=None):
-    """Fetch all issues (excluding PRs) for a repository within the date range."""
+def fetch_enriched_reviews(pr, token=None):
+    """Fetch a PR's reviews via REST, annotated with the PR they belong to.
+
+    Returns None if the fetch failed.
+    """
+    repo_path = pr.get("repository", "")
+    parts = repo_path.split("/")
+    if len(parts) != 2:
+        return None
+    owner, repo = parts
+    pr_number = pr["number"]
+    try:
+        reviews = fetch_reviews_for_pr(owner, repo, pr_number, token)
+        # Annotate copies: the review dicts may be shared with the ETag cache
+        annotations = {
+            "repository": repo_path,
+            "pull_request_url": pr.get("html_url", ""),
+            "pull_request_title": pr.get("title", ""),
+            "pull_request_author": pr["user"]["login"],
+        }
+        return [_slim({**review, **annotations}, REVIEW_FIELDS) for review in reviews]
+    except Exception as exc:
+        logger.error("Failed to fetch reviews for %s#%d: %s", repo_path, pr_number, exc)
+        return None
+
+
+def fetch_reviews_for_prs(prs, token):
+    """Fetch the reviews of up to ``REVIEW_BATCH_SIZE`` PRs in one GraphQL query.
+
+    Returns ``(reviews_by_pr, remaining)``: reviews keyed by PR ``html_url``,
+    and the PRs still to be fetched via REST (those without a node id, with
+    more reviews than one page holds, or all of them if the query failed).
+    """
+    reviews_by_pr = {}
+    remaining = list(prs)
+    batch = [pr for pr in prs if pr.get("node_id")]
+    if batch:
+        data = make_request(
+            GITHUB_GRAPHQL_URL, token,
+            payload={
+                "query": REVIEWS_GRAPHQL_QUERY,
+                "variables": {"ids": [pr["node_id"] for pr in batch]},
+            },
+        )
+        nodes = ((data or {}).get("data") or {}).get("nodes")
+        if data and data.get("errors"):
+            logger.warning("GraphQL review query reported errors: %s", data["errors"])
+        if nodes is not None:
+            remaining = [pr for pr in prs if not pr.get("node_id")]
+            for pr, node in zip(batch, nodes):
+                # Partial responses (with errors) can null out a node or its reviews
+                if (
+                    not node
+                    or not node.get("reviews")
+                    or node["reviews"]["pageInfo"]["hasNextPage"]
+                ):
+                    remaining.append(pr)
+                    continue
+                reviews_by_pr[pr["html_url"]] = [
+                    _graphql_review(review, pr) for review in node["reviews"]["nodes"]
+                ]
+    return reviews_by_pr, remaining
+
+
+def fetch_issues(owner, repo, start_dt, end_dt, token=None, since=None):
+    """Fetch all issues (excluding PRs) for a repository within the date range.
+
+    When ``since`` is given, only issues updated at or after it are returned.
+    """
     logger.info("Fetching issues for %s/%s", owner, repo)
+    # The issues endpoint filters by update time server-side
+    cutoff = max(start_dt, since) if since else start_dt
     url = (
         f"{GITHUB_API_BASE}/repos/{owner}/{repo}"
-        "/issues?state=all&sort=created&direction=desc"
+        "/issues?state=all&sort=updated&direction=desc"
+        f"&since={cutoff.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')}"
     )
     all_items = fetch_all_pages(url, token)
 
@@ -216,17 +786,17 @@ def fetch_issues(owner, repo, start_dt, end_dt, token=None):
     for item in all_items:
         if "pull_request" in item:
             continue  # GitHub returns PRs via the issues endpoint; skip them
-        created_at = datetime.fromisoformat(item["created_at"].replace("Z", "+00:00"))
+        created_at = parse_gh_ts(item["created_at"])
         closed_at = (
-            datetime.fromisoformat(item["closed_at"].replace("Z", "+00:00"))
+            parse_gh_ts(item["closed_at"])
             if item.get("closed_at")
             else None
         )
         relevant_by_creation = start_dt <= created_at <= end_dt
         relevant_by_closure = closed_at and start_dt <= closed_at <= end_dt
         if relevant_by_creation or relevant_by_closure:
-            item["repository"] = f"{owner}/{repo}"
-            filtered.append(item)
+            # Annotate a copy: ``item`` may be shared with the ETag cache
+            filtered.append(_slim({**item, "repository": f"{owner}/{repo}"}, ISSUE_FIELDS))
 
     logger.info("  -> %d issues in date range for %s/%s", len(filtered), owner, repo)
     return filtered
@@ -248,6 +818,199 @@ def fetch_repo_metadata(owner, repo, token=None):
     return None
 
 
+def _graphql_user(author):
+    """Convert a GraphQL actor into the REST ``user`` shape used by the stats."""
+    if not author:
+        # Deleted accounts come back as null; REST reports them as "ghost"
+        return {"login": "ghost", "avatar_url": "", "html_url": "https://github.com/ghost"}
+    login = author["login"]
+    if author.get("__typename") == "Bot":
+        # GraphQL drops the "[bot]" suffix REST logins carry for apps
+        login = f"{login}[bot]"
+    return {
+        "login": login,
+        "avatar_url": author.get("avatarUrl", ""),
+        "html_url": author.get("url", f"https://github.com/{author['login']}"),
+    }
+
+
+def _graphql_review(review, pr):
+    """Convert a GraphQL review node into the REST shape, annotated with its PR."""
+    return {
+        "id": review.get("databaseId"),
+        "user": _graphql_user(review.get("author")),
+        "state": review.get("state", ""),
+        "submitted_at": review.get("submittedAt"),
+        "html_url": review.get("url", ""),
+        "repository": pr["repository"],
+        "pull_request_url": pr["html_url"],
+        "pull_request_title": pr["title"],
+        "pull_request_author": pr["user"]["login"],
+    }
+
+
+def fetch_repo_graphql(owner, repo, start_dt, end_dt, token, pr_since=None, issue_since=None,
+                       max_pages=100):
+    """Fetch PRs, reviews, issues and metadata for a repository via GraphQL.
+
+    Returns the same record shapes as the REST helpers so the results can be
+    fed straight into ``process_hackathon_stats``.  Reviews are embedded in
+    the PR query; PRs with more reviews than fit in one page are returned in
+    ``pending_review_prs`` so the caller can fetch them in full.  When
+    ``pr_since``/``issue_since`` is given, only PRs/issues updated at or
+    after it are returned.  Returns None if the query fails, in which case
+    the caller should fall back to REST.
+    """
+    logger.info("Fetching %s/%s via GraphQL", owner, repo)
+    repo_path = f"{owner}/{repo}"
+    # Items are ordered by updatedAt, so paging stops at the first one older
+    # than both the hackathon start and the caller's watermark.
+    pr_cutoff = max(start_dt, pr_since) if pr_since else start_dt
+    issue_cutoff = max(start_dt, issue_since) if issue_since else start_dt
+    variables = {
+        "owner": owner,
+        "name": repo,
+        "prCursor": None,
+        "issueCursor": None,
+        "withPRs": True,
+        "withIssues": True,
+    }
+    prs = []
+    reviews = []
+    pending_review_prs = []
+    issues = []
+    metadata = None
+
+    for _ in range(max_pages):
+        data = make_request(
+            GITHUB_GRAPHQL_URL, token,
+            payload={"query": REPO_GRAPHQL_QUERY, "variables": variables},
+        )
+        if not data or data.get("errors") or not (data.get("data") or {}).get("repository"):
+            errors = (data or {}).get("errors")
+            logger.warning("GraphQL query failed for %s: %s", repo_path, errors)
+            return None
+        repository = data["data"]["repository"]
+
+        if metadata is None:
+            metadata = {
+                "full_name": repository.get("nameWithOwner"),
+                "description": repository.get("description"),
+                "stargazers_count": repository.get("stargazerCount", 0),
+                "forks_count": repository.get("forkCount", 0),
+                "language": (repository.get("primaryLanguage") or {}).get("name"),
+                "html_url": repository.get("url"),
+            }
+
+        if variables["withPRs"]:
+            connection = repository["pullRequests"]
+            reached_old = False
+            for node in connection["nodes"]:
+                if parse_gh_ts(node["updatedAt"]) < pr_cutoff:
+                    # Ordered by updatedAt: nothing further can fall in range
+                    reached_old = True
+                    break
+                created_at = parse_gh_ts(node["createdAt"])
+                merged_at = (
+                    parse_gh_ts(node["mergedAt"])
+                    if node.get("mergedAt")
+                    else None
+                )
+                relevant_by_creation = start_dt <= created_at <= end_dt
+                relevant_by_merge = merged_at and start_dt <= merged_at <= end_dt
+                if not (relevant_by_creation or relevant_by_merge):
+                    continue
+                pr = {
+                    "node_id": node["id"],
+                    "number": node["number"],
+                    "title": node.get("title", ""),
+                    "html_url": node["url"],
+                    "created_at": node["createdAt"],
+                    "updated_at": node["updatedAt"],
+                    "merged_at": node.get("mergedAt"),
+                    "user": _graphql_user(node.get("author")),
+                    "repository": repo_path,
+                }
+                prs.append(pr)
+                if node["reviews"]["pageInfo"]["hasNextPage"]:
+                    pending_review_prs.append(pr)
+                    continue
+                reviews.extend(_graphql_review(review, pr) for review in node["reviews"]["nodes"])
+            page_info = connection["pageInfo"]
+            variables["prCursor"] = page_info["endCursor"]
+            variables["withPRs"] = page_info["hasNextPage"] and not reached_old
+
+        if variables["withIssues"]:
+            connection = repository["issues"]
+            reached_old = False
+            for node in connection["nodes"]:
+                if parse_gh_ts(node["updatedAt"]) < issue_cutoff:
+                    reached_old = True
+                    break
+                created_at = parse_gh_ts(node["createdAt"])
+                closed_at = (
+                    parse_gh_ts(node["closedAt"])
+                    if node.get("closedAt")
+                    else None
+                )
+                relevant_by_creation = start_dt <= created_at <= end_dt
+                relevant_by_closure = closed_at and start_dt <= closed_at <= end_dt
+                if relevant_by_creation or relevant_by_closure:
+                    issues.append(
+                        {
+                            "number": node["number"],
+                            "state": node["state"].lower(),
+                            "created_at": node["createdAt"],
+                            "updated_at": node["updatedAt"],
+                            "closed_at": node.get("closedAt"),
+                            "repository": repo_path,
+                        }
+                    )
+            page_info = connection["pageInfo"]
+            variables["issueCursor"] = page_info["endCursor"]
+            variables["withIssues"] = page_info["hasNextPage"] and not reached_old
+
+        if not variables["withPRs"] and not variables["withIssues"]:
+            break
+
+    logger.info(
+        "  -> %d PRs, %d reviews, %d issues in date range for %s",
+        len(prs), len(reviews), len(issues), repo_path,
+    )
+    return {
+        "prs": prs,
+        "reviews": reviews,
+        "pending_review_prs": pending_review_prs,
+        "issues": issues,
+        "metadata": metadata,
+    }
+
+
+def fetch_repo_data(owner, repo, start_dt, end_dt, token=None, pr_since=None, issue_since=None):
+    """Fetch everything the stats need for one repository.
+
+    Uses a single GraphQL query per page when a token is available and falls
+    back to the REST endpoints otherwise (GraphQL requires authentication).
+    With REST, reviews are not fetched here: every PR is returned in
+    ``pending_review_prs`` instead.  When ``pr_since``/``issue_since`` is
+    given, only PRs/issues updated at or after it are returned.
+    """
+    if token:
+        result = fetch_repo_graphql(owner, repo, start_dt, end_dt, token, pr_since, issue_since)
+        if result is not None:
+            return result
+        logger.info("Falling back to REST for %s/%s", owner, repo)
+
+    prs = fetch_pull_requests(owner, repo, start_dt, end_dt, token, pr_since)
+    return {
+        "prs": prs,
+        "reviews": [],
+        "pending_review_prs": prs,
+        "issues": fetch_issues(owner, repo, start_dt, end_dt, token, issue_since),
+        "metadata": fetch_repo_metadata(owner, repo, token),
+    }
+
+
 def process_hackathon_stats(prs, all_reviews, issues, start_dt, end_dt, repositories,
                             allowed_participants=None):
     """Process fetched data and compute hackathon statistics.
@@ -257,76 +1020,94 @@ def process_hackathon_stats(prs, all_reviews, issues, start_dt, end_dt, reposito
             provided, only these users are counted in both the contributors
             (merged-PR) leaderboard and the review leaderboard.
     """
+    # Window checks compare raw timestamp strings; only records that fall inside
+    # the window need parsing
+    window_start, window_end = gh_ts_bounds(start_dt, end_dt)
+
+    merged_prs_list = [pr for pr in prs if pr.get("merged_at")]
+    total_prs = len(prs)
+    merged_prs = len(merged_prs_list)
+
+    # Per-repository counts
+    repo_totals = Counter(pr.get("repository", "unknown") for pr in prs)
+    repo_merged = Counter(pr.get("repository", "unknown") for pr in merged_prs_list)
+    repo_issues = Counter(issue.get("repository", "unknown") for issue in issues)
+    repo_closed = Counter(
+        issue.get("repository", "unknown") for issue in issues if issue["state"] == "closed"
+    )
+    repo_stats = {}
+    for repo_key in chain(repositories, repo_totals, repo_issues):
+        if repo_key not in repo_stats:
+            repo_stats[repo_key] = {
+                "total": repo_totals[repo_key],
+                "merged": repo_merged[repo_key],
+                "issues": repo_issues[repo_key],
+                "closedIssues": repo_closed[repo_key],
+            }
+
+    # Daily creation activity (only PRs created inside the window), counted
+    # by day offset from the start instead of by date string
+    start_date = start_dt.date()
+    n_days = (end_dt.date() - start_date).days + 1
+    created_per_day = [0] * n_days
+    for pr in prs:
+        if window_start <= pr["created_at"] <= window_end:
+            offset = (parse_gh_ts(pr["created_at"]).date() - start_date).days
+            # With a non-UTC window the UTC creation date can fall just
+            # outside the window's own dates
+            if 0 <= offset < n_days:
+                created_per_day[offset] += 1
+    # Pre-computed merged PR counts per day (used for the activity chart)
+    daily_merged_prs = dict(Counter(pr["merged_at"][:10] for pr in merged_prs_list))
+
     # Build daily activity map for the full date range
     daily_activity = {}
-    current_date = start_dt.date()
-    end_date = end_dt.date()
-    while current_date <= end_date:
-        daily_activity[current_date.isoformat()] = {"total": 0, "merged": 0}
-        current_date += timedelta(days=1)
+    for offset in range(n_days):
+        day = (start_date + timedelta(days=offset)).isoformat()
+        daily_activity[day] = {
+            "total": created_per_day[offset],
+            "merged": daily_merged_prs.get(day, 0),
+        }
 
-    participants = {}
-    repo_stats = {
-        r: {"total": 0, "merged": 0, "issues": 0, "closedIssues": 0}
-        for r in repositories
-    }
-    total_prs = 0
-    merged_prs = 0
-    # Pre-computed merged PR counts per day (used for the activity chart)
-    daily_merged_prs = {}
+    # The same usernames recur across many PRs and reviews, so each one is
+    # classified once: bots and Copilot are skipped, and when an allowlist
+    # is active so are users not on the list.
+    excluded_users = {}
+
+    def is_excluded(username):
+        excluded = excluded_users.get(username)
+        if excluded is None:
+            lowered = username.lower()
+            excluded = (
+                "[bot]" in username
+                or lowered.endswith("bot")
+                or "copilot" in lowered
+                or (allowed_participants is not None and lowered not in allowed_participants)
+            )
+            excluded_users[username] = excluded
+        return excluded
 
+    # Track participants (PRs opened via Copilot are skipped too)
+    participants = {}
     for pr in prs:
-        is_merged = bool(pr.get("merged_at"))
         username = pr["user"]["login"]
-        is_bot = "[bot]" in username or username.lower().endswith("bot")
-        title = pr.get("title", "")
-        is_copilot = "copilot" in username.lower() or "copilot" in title.lower()
-
-        total_prs += 1
-        if is_merged:
-            merged_prs += 1
-
-        # Track per-repository stats
-        repo_key = pr.get("repository", "unknown")
-        if repo_key not in repo_stats:
-            repo_stats[repo_key] = {"total": 0, "merged": 0, "issues": 0, "closedIssues": 0}
-        repo_stats[repo_key]["total"] += 1
-        if is_merged:
-            repo_stats[repo_key]["merged"] += 1
-
-        # Track daily creation activity
-        created_at = datetime.fromisoformat(pr["created_at"].replace("Z", "+00:00"))
-        created_date = created_at.date().isoformat()
-        if created_date in daily_activity and start_dt <= created_at <= end_dt:
-            daily_activity[created_date]["total"] += 1
-
-        # Track daily merged activity
-        if is_merged:
-            merged_date = pr["merged_at"][:10]
-            if merged_date in daily_activity:
-                daily_activity[merged_date]["merged"] += 1
-            daily_merged_prs[merged_date] = daily_merged_prs.get(merged_date, 0) + 1
-
-        # Track participants (skip bots and Copilot)
-        # When an allowlist is active, also skip users not on the list.
-        if not is_bot and not is_copilot:
-            if allowed_participants is not None and username.lower() not in allowed_participants:
-                continue
-            if username not in participants:
-                participants[username] = {
-                    "username": username,
-                    "avatar": pr["user"].get("avatar_url", ""),
-                    "url": pr["user"].get(
-                        "html_url", f"https://github.com/{username}"
-                    ),
-                    "mergedCount": 0,
-                    "prCount": 0,
-                    "reviewCount": 0,
-                    "reviews": [],
-                }
-            participants[username]["prCount"] += 1
-            if is_merged:
-                participants[username]["mergedCount"] += 1
+        if is_excluded(username) or "copilot" in pr.get("title", "").lower():
+            continue
+        if username not in participants:
+            participants[username] = {
+                "username": username,
+                "avatar": pr["user"].get("avatar_url", ""),
+                "url": pr["user"].get(
+                    "html_url", f"https://github.com/{username}"
+                ),
+                "mergedCount": 0,
+                "prCount": 0,
+                "reviewCount": 0,
+                "reviews": [],
+            }
+        participants[username]["prCount"] += 1
+        if pr.get("merged_at"):
+            participants[username]["mergedCount"] += 1
 
     # Map PR URL to author
     pr_authors = {pr["html_url"]: pr["user"]["login"] for pr in prs}
@@ -334,23 +1115,11 @@ def process_hackathon_stats(prs, all_reviews, issues, start_dt, end_dt, reposito
     # Process reviews
     for review in all_reviews:
         username = review["user"]["login"]
-        is_bot = "[bot]" in username or username.lower().endswith("bot")
-        is_copilot = "copilot" in username.lower()
-        state = review.get("state", "")
-
-        if is_bot or is_copilot or state == "DISMISSED":
-            continue
-
-        # When an allowlist is active, skip reviewers not on the list.
-        if allowed_participants is not None and username.lower() not in allowed_participants:
-            continue
-
-        submitted_at_str = review.get("submitted_at")
-        if not submitted_at_str:
+        if is_excluded(username) or review.get("state", "") == "DISMISSED":
             continue
 
-        submitted_at = datetime.fromisoformat(submitted_at_str.replace("Z", "+00:00"))
-        if not (start_dt <= submitted_at <= end_dt):
+        submitted_at = review.get("submitted_at")
+        if not submitted_at or not (window_start <= submitted_at <= window_end):
             continue
 
         # Exclude self-reviews
@@ -377,7 +1146,7 @@ def process_hackathon_stats(prs, all_reviews, issues, start_dt, end_dt, reposito
             {
                 "id": review.get("id"),
                 "state": review.get("state"),
-                "submitted_at": review.get("submitted_at"),
+                "submitted_at": submitted_at,
                 "html_url": review.get("html_url", ""),
                 "pull_request_url": pr_url,
                 "pull_request_title": review.get("pull_request_title", ""),
@@ -385,28 +1154,18 @@ def process_hackathon_stats(prs, all_reviews, issues, start_dt, end_dt, reposito
             }
         )
 
-    # Process issues
-    total_issues = 0
-    closed_issues = 0
-    for issue in issues:
-        repo_key = issue.get("repository", "unknown")
-        if repo_key not in repo_stats:
-            repo_stats[repo_key] = {"total": 0, "merged": 0, "issues": 0, "closedIssues": 0}
-        repo_stats[repo_key]["issues"] += 1
-        total_issues += 1
-        if issue["state"] == "closed":
-            repo_stats[repo_key]["closedIssues"] += 1
-            closed_issues += 1
+    total_issues = len(issues)
+    closed_issues = sum(repo_closed.values())
 
     # Build sorted leaderboards
     leaderboard = sorted(
         [p for p in participants.values() if p["mergedCount"] > 0],
-        key=lambda x: x["mergedCount"],
+        key=itemgetter("mergedCount"),
         reverse=True,
     )
     review_leaderboard = sorted(
         [p for p in participants.values() if p["reviewCount"] > 0],
-        key=lambda x: x["reviewCount"],
+        key=itemgetter("reviewCount"),
         reverse=True,
     )
 
@@ -443,40 +1202,38 @@ def process_hackathon(hackathon_config, token, org_repos_cache=None):
     participants_file = hackathon_config.get("participantsFile")
     allowed_participants = load_participants_allowlist(participants_file)
 
-    start_dt = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
-    end_dt = datetime.fromisoformat(end_time.replace("Z", "+00:00"))
+    start_dt = parse_gh_ts(start_time)
+    end_dt = parse_gh_ts(end_time)
     
-    # Load existing data for incremental review fetching
-    existing_data = load_existing_data(slug)
-    since = None
-    
-    if existing_data:
-        last_updated = existing_data.get("lastUpdated")
-        if last_updated:
-            # Use this to determine which PRs need review fetching
-            since = datetime.fromisoformat(last_updated.replace("Z", "+00:00")) - timedelta(minutes=5)
-            logger.info("Incremental review fetch for %s since %s", name, since.isoformat())
+    # Raw records from the previous run.  Each one holds the newest PR and
+    # issue updated_at seen for its repository; only items updated since
+    # those watermarks are fetched again and overlaid on the stored records.
+    raw_store = load_raw_store(slug, [start_time, end_time])
+    if raw_store:
+        logger.info("Incremental fetch for %s (%d stored repositories)", name, len(raw_store))
 
     # Resolve repositories (explicit list + org repos)
     repositories = list(explicit_repos)
+    org_repos = []
     if organization:
         # Use cached org repos if available
-        if org_repos_cache and organization in org_repos_cache:
-            org_repos = org_repos_cache[organization]
-            logger.info("Using cached org repos for %s (%d repos)", organization, len(org_repos))
-        else:
-            try:
-                org_repos = fetch_org_repos(organization, token)
-                if org_repos and org_repos_cache is not None:
-                    org_repos_cache[organization] = org_repos
-            except Exception as exc:
-                logger.error(
-                    "Failed to fetch org repos for %s, using explicit list: %s",
-                    organization,
-                    exc,
-                )
-                org_repos = []
-        
+        with _org_repos_lock:
+            if org_repos_cache and organization in org_repos_cache:
+                org_repos = org_repos_cache[organization]
+                logger.info("Using cached org repos for %s (%d repos)", organization, len(org_repos))
+            else:
+                try:
+                    org_repos = fetch_org_repos(organization, token)
+                    if org_repos and org_repos_cache is not None:
+                        org_repos_cache[organization] = org_repos
+                except Exception as exc:
+                    logger.error(
+                        "Failed to fetch org repos for %s, using explicit list: %s",
+                        organization,
+                        exc,
+                    )
+                    org_repos = []
+
         if org_repos:
             combined = list({*repositories, *org_repos})
             repositories = combined
@@ -492,11 +1249,15 @@ def process_hackathon(hackathon_config, token, org_repos_cache=None):
         logger.warning("No repositories found for hackathon: %s", name)
         return None
 
-    # Fetch all PRs across all repositories in parallel
-    all_prs = []
-    logger.info("Fetching PRs for %d repositories in parallel...", len(repositories))
-    
-    with ThreadPoolExecutor(max_workers=10) as executor:
+    # Fetch every repository on one shared pool.  Review fetches that are
+    # still needed are queued as soon as each repository's data arrives, so
+    # no phase waits for the slowest repository of the previous one.
+    results = {}
+    # PR URLs per repository whose reviews were fetched fresh this run
+    reviewed_pr_urls = {}
+    logger.info("Fetching data for %d repositories in parallel...", len(repositories))
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
         future_to_repo = {}
         for repo_path in repositories:
             parts = repo_path.split("/")
@@ -504,157 +1265,128 @@ def process_hackathon(hackathon_config, token, org_repos_cache=None):
                 logger.warning("Skipping invalid repo path: %s", repo_path)
                 continue
             owner, repo = parts
-            future = executor.submit(fetch_pull_requests, owner, repo, start_dt, end_dt, token)
+            stored = raw_store.get(repo_path, {})
+            pr_since, issue_since = (
+                parse_gh_ts(stored[key]) - WATERMARK_MARGIN if stored.get(key) else None
+                for key in ("prWatermark", "issueWatermark")
+            )
+            future = executor.submit(
+                fetch_repo_data, owner, repo, start_dt, end_dt, token, pr_since, issue_since
+            )
             future_to_repo[future] = repo_path
 
+        # GraphQL review batches, and single-PR REST review fetches
+        future_to_batch = {}
+        future_to_pr = {}
         for future in as_completed(future_to_repo):
             repo_path = future_to_repo[future]
             try:
-                prs = future.result()
-                if prs:
-                    all_prs.extend(prs)
+                result = future.result()
             except Exception as exc:
-                logger.error("Failed to fetch PRs for %s: %s", repo_path, exc)
-
-    logger.info("Total PRs fetched for %s: %d", name, len(all_prs))
-    
-    # Determine which PRs need review fetching (only recently updated ones)
-    if since:
-        prs_to_fetch_reviews = [
-            pr for pr in all_prs
-            if datetime.fromisoformat(pr["updated_at"].replace("Z", "+00:00")) >= since
-        ]
-        logger.info("PRs updated since last run: %d (will fetch reviews for these)", len(prs_to_fetch_reviews))
-    else:
-        prs_to_fetch_reviews = all_prs
-
-    # Fetch reviews only for updated PRs in parallel
-    all_reviews = []
-    
-    if prs_to_fetch_reviews:
-        logger.info("Fetching reviews for %d PRs in parallel...", len(prs_to_fetch_reviews))
-        
-        def fetch_enriched_reviews(pr):
-            repo_path = pr.get("repository", "")
-            parts = repo_path.split("/")
-            if len(parts) != 2:
-                return []
-            owner, repo = parts
-            pr_number = pr["number"]
-            try:
-                reviews = fetch_reviews_for_pr(owner, repo, pr_number, token)
-                for review in reviews:
-                    review["repository"] = repo_path
-                    review["pull_request_url"] = pr.get("html_url", "")
-                    review["pull_request_title"] = pr.get("title", "")
-                    review["pull_request_author"] = pr["user"]["login"]
-                return reviews
-            except Exception as exc:
-                logger.error("Failed to fetch reviews for %s#%d: %s", repo_path, pr_number, exc)
-                return []
-
-        with ThreadPoolExecutor(max_workers=20) as executor:
-            future_to_pr = {executor.submit(fetch_enriched_reviews, pr): pr for pr in prs_to_fetch_reviews}
-            for future in as_completed(future_to_pr):
-                reviews = future.result()
-                if reviews:
-                    all_reviews.extend(reviews)
-    
-        logger.info("Total reviews fetched for %s: %d", name, len(all_reviews))
-    else:
-        logger.info("No new PRs to fetch reviews for %s", name)
-
-    # Merge with old reviews if incremental
-    if since and existing_data:
-        old_reviews = []
-        old_participants = existing_data.get("stats", {}).get("leaderboard", []) + \
-                          existing_data.get("stats", {}).get("reviewLeaderboard", [])
-        
-        # Track which PRs we just fetched reviews for, so we don't duplicate them
-        newly_fetched_pr_urls = {pr["html_url"] for pr in prs_to_fetch_reviews}
-        
-        # Extract reviews from existing leaderboard/paticipants
-        seen_review_ids = {r["id"] for r in all_reviews if r.get("id")}
-        
-        for p in old_participants:
-            for r in p.get("reviews", []):
-                review_id = r.get("id")
-                pr_url = r.get("pull_request_url")
-                
-                # Skip if we just fetched fresh reviews for this PR
-                if pr_url in newly_fetched_pr_urls:
-                    continue
-                    
-                # Skip if we somehow already have this review ID
-                if review_id and review_id in seen_review_ids:
-                    continue
-                
-                # Reconstruct enough of the review object for process_hackathon_stats
-                # We need: user.login, submitted_at, state, id, html_url, pull_request_url, pull_request_title, pull_request_author
-                reconstructed_review = {
-                    "id": review_id,
-                    "user": {"login": p["username"]},
-                    "submitted_at": r.get("submitted_at"),
-                    "state": r.get("state"),
-                    "html_url": r.get("html_url"),
-                    "pull_request_url": pr_url,
-                    "pull_request_title": r.get("pull_request_title"),
-                    "pull_request_author": r.get("pull_request_author"),
-                }
-                old_reviews.append(reconstructed_review)
-                if review_id:
-                    seen_review_ids.add(review_id)
-        
-        logger.info("Merged %d old reviews from existing data", len(old_reviews))
-        all_reviews.extend(old_reviews)
-
-    # Fetch all issues across all repositories
-    all_issues = []
-    logger.info("Fetching issues for %d repositories in parallel...", len(repositories))
-    
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        future_to_repo_issues = {}
-        for repo_path in repositories:
-            parts = repo_path.split("/")
-            if len(parts) != 2:
+                logger.error("Failed to fetch data for %s: %s", repo_path, exc)
                 continue
-            owner, repo = parts
-            future = executor.submit(fetch_issues, owner, repo, start_dt, end_dt, token)
-            future_to_repo_issues[future] = repo_path
+            results[repo_path] = result
 
-        for future in as_completed(future_to_repo_issues):
-            repo_path = future_to_repo_issues[future]
-            try:
-                issues = future.result()
-                if issues:
-                    all_issues.extend(issues)
-            except Exception as exc:
-                logger.error("Failed to fetch issues for %s: %s", repo_path, exc)
-
-    logger.info("Total issues fetched for %s: %d", name, len(all_issues))
+            # PRs whose reviews arrived with the PR query are already fresh
+            pending_urls = {pr["html_url"] for pr in result["pending_review_prs"]}
+            reviewed_pr_urls[repo_path] = {
+                pr["html_url"] for pr in result["prs"] if pr["html_url"] not in pending_urls
+            }
+            # Only PRs updated since the repo's watermark were returned, so
+            # every pending PR needs its reviews refreshed.  Without a token
+            # each PR costs its own REST request anyway.
+            pending = result["pending_review_prs"]
+            if token:
+                for i in range(0, len(pending), REVIEW_BATCH_SIZE):
+                    batch = pending[i:i + REVIEW_BATCH_SIZE]
+                    future_to_batch[executor.submit(fetch_reviews_for_prs, batch, token)] = batch
+            else:
+                for pr in pending:
+                    future_to_pr[executor.submit(fetch_enriched_reviews, pr, token)] = pr
+
+        logger.info(
+            "Fetched %d updated PRs and %d updated issues for %s",
+            sum(len(r["prs"]) for r in results.values()),
+            sum(len(r["issues"]) for r in results.values()),
+            name,
+        )
+        logger.info(
+            "Fetching reviews for %d PRs (%d GraphQL batches)...",
+            sum(len(batch) for batch in future_to_batch.values()) + len(future_to_pr),
+            len(future_to_batch),
+        )
 
-    # Fetch repository metadata in parallel
-    repo_data = []
-    logger.info("Fetching repository metadata in parallel...")
-    
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        future_to_repo_meta = {}
-        for repo_path in repositories:
-            parts = repo_path.split("/")
-            if len(parts) != 2:
-                continue
-            owner, repo = parts
-            future = executor.submit(fetch_repo_metadata, owner, repo, token)
-            future_to_repo_meta[future] = repo_path
+        def add_reviews(pr, reviews):
+            results[pr["repository"]]["reviews"].extend(reviews)
+            reviewed_pr_urls[pr["repository"]].add(pr["html_url"])
 
-        for future in as_completed(future_to_repo_meta):
-            repo_path = future_to_repo_meta[future]
+        for future in as_completed(future_to_batch):
             try:
-                meta = future.result()
-                if meta:
-                    repo_data.append(meta)
+                reviews_by_pr, remaining = future.result()
             except Exception as exc:
-                logger.error("Failed to fetch metadata for %s: %s", repo_path, exc)
+                logger.error("GraphQL review batch failed, falling back to REST: %s", exc)
+                reviews_by_pr, remaining = {}, future_to_batch[future]
+            for pr in future_to_batch[future]:
+                if pr["html_url"] in reviews_by_pr:
+                    add_reviews(pr, reviews_by_pr[pr["html_url"]])
+            # PRs the batch could not cover go back to the pool one by one
+            for pr in remaining:
+                future_to_pr[executor.submit(fetch_enriched_reviews, pr, token)] = pr
+
+        for future in as_completed(future_to_pr):
+            reviews = future.result()
+            if reviews is not None:  # otherwise keep the stored reviews
+                add_reviews(future_to_pr[future], reviews)
+
+    # Overlay the fresh records on the stored ones, keyed by number within
+    # each repository.  Repositories that failed to fetch keep their
+    # stored records and watermarks unchanged.
+    for repo_path, result in results.items():
+        stored = raw_store.get(repo_path, {})
+        prs = {pr["number"]: pr for pr in stored.get("prs", [])}
+        prs.update((pr["number"], _slim(pr, PR_FIELDS)) for pr in result["prs"])
+        issues = {issue["number"]: issue for issue in stored.get("issues", [])}
+        issues.update((issue["number"], _slim(issue, ISSUE_FIELDS)) for issue in result["issues"])
+        refreshed = reviewed_pr_urls[repo_path]
+        reviews = [r for r in stored.get("reviews", []) if r.get("pull_request_url") not in refreshed]
+        reviews.extend(_slim(r, REVIEW_FIELDS) for r in result["reviews"])
+        # PRs and issues come from separate requests, so each keeps its own
+        # watermark: the newest updated_at seen so far for that kind of item
+        watermarks = {}
+        for key, items in (("prWatermark", result["prs"]), ("issueWatermark", result["issues"])):
+            seen = [item["updated_at"] for item in items]
+            if stored.get(key):
+                seen.append(stored[key])
+            watermarks[key] = max(seen, default=None)
+        # PRs whose reviews could not be refreshed must come back next run,
+        # so the PR watermark stays at or below the oldest of them
+        unreviewed = [pr["updated_at"] for pr in result["prs"] if pr["html_url"] not in refreshed]
+        if unreviewed:
+            watermarks["prWatermark"] = min(watermarks["prWatermark"], min(unreviewed))
+        raw_store[repo_path] = {
+            "repository": repo_path,
+            "window": [start_time, end_time],
+            **watermarks,
+            "prs": list(prs.values()),
+            "reviews": reviews,
+            "issues": list(issues.values()),
+            "metadata": result["metadata"] or stored.get("metadata"),
+        }
+
+    # Forget repositories that are no longer part of the hackathon.  If the
+    # org listing failed, the list is incomplete and nothing is dropped.
+    if org_repos or not organization:
+        raw_store = {r: raw_store[r] for r in repositories if r in raw_store}
+    save_raw_store(slug, raw_store)
+
+    all_prs = [pr for record in raw_store.values() for pr in record["prs"]]
+    all_reviews = [r for record in raw_store.values() for r in record["reviews"]]
+    all_issues = [issue for record in raw_store.values() for issue in record["issues"]]
+    repo_data = [record["metadata"] for record in raw_store.values() if record["metadata"]]
+    logger.info(
+        "Totals for %s: %d PRs, %d reviews, %d issues",
+        name, len(all_prs), len(all_reviews), len(all_issues),
+    )
 
     # Compute stats
     stats = process_hackathon_stats(
@@ -723,9 +1455,13 @@ def main():
     # Create output directory
     os.makedirs("hackathon-data", exist_ok=True)
     
-    # Cache for org repos to avoid fetching multiple times
-    org_repos_cache = {}
+    # Cache for org repos to avoid fetching multiple times, seeded with the
+    # lists fetched by recent runs
+    org_cache_entries = load_org_repos_cache()
+    org_repos_cache = {org: entry["repos"] for org, entry in org_cache_entries.items()}
+    load_etag_cache()
 
+    active = []
     for hackathon in hackathons:
         slug = hackathon.get("slug", "unknown")
         name = hackathon.get("name", slug)
@@ -746,31 +1482,45 @@ def main():
                     try:
                         with open(output_path, "r", encoding="utf-8") as f:
                             existing = json.load(f)
-                        with open(summary_path, "w", encoding="utf-8") as f:
-                            json.dump(build_summary(existing), f, indent=2)
+                        write_json(summary_path, build_summary(existing), indent=2)
                         logger.info("✅ Generated summary for ended hackathon '%s'", slug)
                     except Exception as exc:
                         logger.warning("Could not generate summary for %s: %s", slug, exc)
                 continue
         
-        logger.info("🔄 Processing active hackathon: %s", name)
-        try:
-            data = process_hackathon(hackathon, token, org_repos_cache)
-            if data:
-                output_path = f"hackathon-data/{slug}.json"
-                with open(output_path, "w", encoding="utf-8") as f:
-                    json.dump(data, f, indent=2)
-                logger.info("✅ Saved stats for '%s' to %s", slug, output_path)
-                # Write lightweight summary file for the index page
-                summary_path = f"hackathon-data/{slug}-summary.json"
-                with open(summary_path, "w", encoding="utf-8") as f:
-                    json.dump(build_summary(data), f, indent=2)
-                logger.info("✅ Saved summary for '%s' to %s", slug, summary_path)
-        except Exception as exc:
-            logger.error("❌ Failed to process hackathon %s: %s", slug, exc)
-            import traceback
-
-            traceback.print_exc()
+        active.append(hackathon)
+
+    # Hackathons hit mostly disjoint repositories, so process them side by
+    # side; each one already bounds its own request concurrency.
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_HACKATHONS) as executor:
+        future_to_hackathon = {}
+        for hackathon in active:
+            logger.info("🔄 Processing active hackathon: %s", hackathon.get("name"))
+            future = executor.submit(process_hackathon, hackathon, token, org_repos_cache)
+            future_to_hackathon[future] = hackathon
+
+        for future in as_completed(future_to_hackathon):
+            slug = future_to_hackathon[future].get("slug", "unknown")
+            try:
+                data = future.result()
+                if data:
+                    output_path = f"hackathon-data/{slug}.json"
+                    # The detail file is the largest output and is only read
+                    # by the frontend, so it is written without indentation
+                    write_json(output_path, data)
+                    logger.info("✅ Saved stats for '%s' to %s", slug, output_path)
+                    # Write lightweight summary file for the index page
+                    summary_path = f"hackathon-data/{slug}-summary.json"
+                    write_json(summary_path, build_summary(data), indent=2)
+                    logger.info("✅ Saved summary for '%s' to %s", slug, summary_path)
+            except Exception as exc:
+                logger.error("❌ Failed to process hackathon %s: %s", slug, exc)
+                import traceback
+
+                traceback.print_exc()
+
+    save_etag_cache()
+    save_org_repos_cache(org_cache_entries, org_repos_cache)
 
     # Update the top-level stats.json with basic summary info
     primary = hackathons[0] if hackathons else {}
@@ -795,8 +1545,7 @@ def main():
             for h in hackathons
         ],
     }
-    with open("stats.json", "w", encoding="utf-8") as f:
-        json.dump(stats_data, f, indent=2)
+    write_json("stats.json", stats_data, indent=2)
     logger.info("Updated stats.json")
 
 